@@ -128,7 +128,7 @@ class Adiabatic:
             reactor.temperature_profile,
             reactor.pressure_profile,
         )
-        total_mole_flows = reactor.mass_profile.sum(axis=0)
+        total_mole_flows = reactor.total_molar_flow_profile
 
         numerator = -np.multiply(delta_hs, reactor.r_rates_profile).sum(axis=0)
         denominator = np.multiply(cps, total_mole_flows)
@@ -148,7 +148,7 @@ class NoIsothermicAllConstant:
             reactor.temperature_profile,
             reactor.pressure_profile,
         )
-        total_mole_flows = reactor.mass_profile.sum(axis=0)
+        total_mole_flows = reactor.total_molar_flow_profile
 
         a = 4 / (2 * reactor.tube_radius)
 
@@ -151,11 +151,13 @@ class NoIsothermicUConstant(NoIsothermicAllConstant):
             reactor.temperature_profile,
             reactor.pressure_profile,
         )
-        total_mole_flows = reactor.mass_profile.sum(axis=0)
+        total_mole_flows = reactor.total_molar_flow_profile
 
-        a = 4 / (2 * reactor.tube_radius)
+        # Heat exchanged per reactor volume and temperature difference,
+        # shared by the reactor and refrigerant balances.
+        u_a = self.u * 4 / (2 * reactor.tube_radius)
 
-        numerator = self.u * a * (
+        numerator = u_a * (
             reactor.refrigerant_temperature_profile
             - reactor.temperature_profile
         ) - np.multiply(delta_hs, reactor.r_rates_profile).sum(axis=0)
@@ -176,8 +178,7 @@ class NoIsothermicUConstant(NoIsothermicAllConstant):
 
         numerator_ref = (
             self.arrangement_coeff
-            * self.u
-            * a
+            * u_a
             * (
                 reactor.temperature_profile
                 - reactor.refrigerant_temperature_profile
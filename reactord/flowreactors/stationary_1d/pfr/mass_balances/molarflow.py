@@ -135,7 +135,7 @@ class MolarFlow:
         """
         # Reaction rate of each substance on each reactor's z
         ri = np.matmul(
-            reactor.kinetic.stoichiometry.T, reactor.r_rates_profile
+            reactor.kinetic.stoichiometry_t, reactor.r_rates_profile
         )
 
         return ri * reactor.transversal_area
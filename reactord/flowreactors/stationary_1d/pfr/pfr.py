@@ -69,6 +69,7 @@ class PFR:
         self.z = np.array([])
         self.mass_profile = np.array([])
         self.mole_fraction_profile = np.array([])
+        self.total_molar_flow_profile = np.array([])
         self.temperature_profile = np.array([])
         self.refrigerant_temperature_profile = np.array([])
         self.pressure_profile = np.array([])
@@ -111,19 +112,21 @@ class PFR:
         self.pressure_bc = self.pressure_balance.border_conditions(self)
 
         # Inlet conditions:
-        self.inlet_conditions = np.append(
-            self.mass_bc[0], self.temperature_bc[0]
-        )
-        self.inlet_conditions = np.append(
-            self.inlet_conditions, self.pressure_bc[0]
+        self.inlet_conditions = np.concatenate(
+            (
+                np.atleast_1d(self.mass_bc[0]),
+                np.atleast_1d(self.temperature_bc[0]),
+                np.atleast_1d(self.pressure_bc[0]),
+            )
         )
 
         # Outlet conditions:
-        self.outlet_conditions = np.append(
-            self.mass_bc[1], self.temperature_bc[1]
-        )
-        self.outlet_conditions = np.append(
-            self.outlet_conditions, self.pressure_bc[1]
+        self.outlet_conditions = np.concatenate(
+            (
+                np.atleast_1d(self.mass_bc[1]),
+                np.atleast_1d(self.temperature_bc[1]),
+                np.atleast_1d(self.pressure_bc[1]),
+            )
         )
 
         # Index where border conditions are specified:
@@ -134,6 +137,15 @@ class PFR:
             np.not_equal(self.outlet_conditions, None)
         ).ravel()
 
+        # Specified border condition values as float arrays, gathered once
+        # here so border_conditions() reduces to vectorized subtractions.
+        self._in_values = self.inlet_conditions[self._in_index].astype(
+            np.float64
+        )
+        self._out_values = self.outlet_conditions[self._out_index].astype(
+            np.float64
+        )
+
     def border_conditions(self, ya, yb) -> NDArray[np.float64]:
         """Border condition builder for scipy.solve_bvp.
 
@@ -149,13 +161,12 @@ class PFR:
         NDArray[np.float64]
             Border conditions for scipy.solve_bvp.
         """
-        bc = np.array([])
-
-        for idx in self._in_index:
-            bc = np.append(bc, ya[idx] - self.inlet_conditions[idx])
-
-        for idx in self._out_index:
-            bc = np.append(bc, yb[idx] - self.outlet_conditions[idx])
+        bc = np.concatenate(
+            (
+                ya[self._in_index] - self._in_values,
+                yb[self._out_index] - self._out_values,
+            )
+        )
 
         return bc
 
@@ -185,6 +196,7 @@ class PFR:
         self.pressure_balance.update_profile(self, variables)
 
         self.mole_fraction_profile = self.mix.mole_fractions(self.mass_profile)
+        self.total_molar_flow_profile = self.mass_profile.sum(axis=0)
 
         self.r_rates_profile = self.kinetic.evaluate(
             self.mole_fraction_profile,
@@ -240,6 +252,7 @@ class PFR:
         self.energy_balance.update_profile(self, self.ode_solution.y)
         self.pressure_balance.update_profile(self, self.ode_solution.y)
         self.mole_fraction_profile = self.mix.mole_fractions(self.mass_profile)
+        self.total_molar_flow_profile = self.mass_profile.sum(axis=0)
         self.r_rates_profile = self.kinetic.evaluate(
             self.mole_fraction_profile,
             self.temperature_profile,
@@ -247,8 +260,6 @@ class PFR:
         )
 
         # Build data frame
-        result = np.vstack((self.z, self.ode_solution.y))
-        z = np.array(["z"])
         names = self.mix.names
         if self.refrigerant_temperature_profile is not None:
             last = np.array(
@@ -257,8 +268,11 @@ class PFR:
         else:
             last = np.array(["temperature", "pressure"])
 
-        columns = np.concatenate((z, names, last))
-        self.sim_df = pd.DataFrame(result.T, columns=columns, index=None)
+        columns = np.concatenate((names, last))
+        self.sim_df = pd.DataFrame(
+            self.ode_solution.y.T, columns=columns, index=None
+        )
+        self.sim_df.insert(0, "z", self.z)
 
     @property
     def irepr(self) -> None:
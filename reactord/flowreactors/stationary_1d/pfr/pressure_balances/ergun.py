@@ -39,6 +39,15 @@ class Ergun:
         self.porosity = porosity
         self.particle_diameter = particle_diameter
 
+        # Composition-independent Ergun factors evaluated once here instead
+        # of on each balance evaluation.
+        self._bed_factor = (
+            (1 - self.porosity) / self.porosity**3 / self.particle_diameter
+        )
+        self._viscous_factor = (
+            150 * (1 - self.porosity) / self.particle_diameter
+        )
+
         if self._inlet_pressure and self._outlet_pressure:
             raise ValueError(
                 "Pressure balance error: Only inlet or outlet border condition"
@@ -113,9 +122,6 @@ class Ergun:
         NDArray[np.float64]
             Pressure rate of each substance on each reactor's z.
         """
-        phi = self.porosity
-        dp = self.particle_diameter
-
         m_rho = reactor.mix.mass_density(
             reactor.mole_fraction_profile,
             reactor.temperature_profile,
@@ -127,7 +133,7 @@ class Ergun:
             reactor.pressure_profile,
         )
         g = (
-            np.sum(reactor.mass_profile[:, 0])
+            reactor.total_molar_flow_profile[0]
             * reactor.mix.mix_molecular_weight(
                 reactor.mole_fraction_profile[:, 0]
             )
@@ -137,11 +143,9 @@ class Ergun:
 
         pressure_gradient = (
             -g
+            * self._bed_factor
             / m_rho
-            / dp
-            * (1 - phi)
-            / phi**3
-            * (150 * (1 - phi) * mu / dp + 1.75 * g)
+            * (self._viscous_factor * mu + 1.75 * g)
         )
         return pressure_gradient
 
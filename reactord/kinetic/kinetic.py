@@ -33,8 +33,12 @@ class Kinetic:
         where "r1" is the reaction name, "eq" is the chemical equation and
         r1_rate is defined function of concentration of a and b (in this case)
         callable(composition: CompositionalArgument,
-        temperature: float, constants: dict)
-        --> rate: float
+        temperature: Union[float, NDArray], constants: dict)
+        --> rate: Union[float, NDArray]
+        Each rate function is evaluated once on the full composition,
+        temperature and pressure profiles, so it must operate element-wise
+        on arrays and return one rate per grid point following the NumPy
+        broadcasting rules.
     kinetic_constants: dict
         Dictionary with kinetic constants.
         There are two keys for each reaction. "a" key is pre-exponential number
@@ -46,7 +50,7 @@ class Kinetic:
         of the reactive mixture inside the reactor.
         Options:
         'concentration': substance concentration. [mol/m^3]
-        'partial_pressure': substance partial pressure. [Pa]
+        'partial pressure': substance partial pressure. [Pa]
     """
 
     def __init__(
@@ -81,10 +85,19 @@ class Kinetic:
             self._arg_func = self.mix.concentrations
         elif self.r_argument == "partial pressure":
             self._arg_func = self.mix.partial_pressures
+        else:
+            raise ValueError(
+                f"{self.r_argument} is not a valid rates argument."
+            )
 
         # Build stochiometry matrix from the substances' algebraic expression
         self.stoichiometry = stoichiometry_matrix_builder(self.mix, self.r_eqs)
 
+        # Contiguous transposed copy for the (substances x reactions) side of
+        # the projection, avoiding a strided matmul on each mass balance
+        # evaluation.
+        self.stoichiometry_t = np.ascontiguousarray(self.stoichiometry.T)
+
         # Kinetic compositional argument object
         self.comp_argument = CompositionalArgument(self.mix.names)
 
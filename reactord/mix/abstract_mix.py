@@ -1,5 +1,5 @@
 """Abstract_mix Module."""
-from abc import ABCMeta, abstractmethod
+from abc import ABC, abstractmethod
 from typing import Callable, List, Union
 
 import numpy as np
@@ -13,7 +13,7 @@ from reactord.mix.viscosity_mixing_rules.linearmix import linear
 from reactord.substance.substance import Substance
 
 
-class AbstractMix(metaclass=ABCMeta):
+class AbstractMix(ABC):
     """Mixture objects abstract class.
 
     Parameters
@@ -52,10 +52,10 @@ class AbstractMix(metaclass=ABCMeta):
         [J/mol]
     """
 
-    substances: List[Substance] = []
-    phase_nature: str = "gas"
-    viscosity_mixing_rule: str = "linear"
-    _viscosity_mixing_rule_function: Callable = linear
+    substances: List[Substance]
+    phase_nature: str
+    viscosity_mixing_rule: str
+    _viscosity_mixing_rule_function: Callable
 
     def __init__(
         self,
@@ -91,42 +91,33 @@ class AbstractMix(metaclass=ABCMeta):
         # =====================================================================
         # Put substances attributes in arrays.
         # =====================================================================
-        self.names = np.array([])
-        self.molecular_weights = np.array([])
-        self.normal_boiling_points = np.array([])
-        self.normal_melting_points = np.array([])
-        self.critical_temperatures = np.array([])
-        self.critical_pressures = np.array([])
-        self.acentric_factors = np.array([])
-        self.formation_enthalpies = np.array([])
-        self.formation_enthalpies_ig = np.array([])
-
-        for substance in self.substances:
-            self.names = np.append(self.names, substance.name)
-            self.molecular_weights = np.append(
-                self.molecular_weights, substance.molecular_weight
-            )
-            self.normal_boiling_points = np.append(
-                self.normal_boiling_points, substance.normal_boiling_point
-            )
-            self.normal_melting_points = np.append(
-                self.normal_melting_points, substance.normal_melting_point
-            )
-            self.critical_temperatures = np.append(
-                self.critical_temperatures, substance.critical_temperature
-            )
-            self.critical_pressures = np.append(
-                self.critical_pressures, substance.critical_pressure
-            )
-            self.acentric_factors = np.append(
-                self.acentric_factors, substance.acentric_factor
-            )
-            self.formation_enthalpies = np.append(
-                self.formation_enthalpies, substance.formation_enthalpy
-            )
-            self.formation_enthalpies_ig = np.append(
-                self.formation_enthalpies_ig, substance.formation_enthalpy_ig
-            )
+        self.names = np.array(
+            [substance.name for substance in self.substances]
+        )
+        self.molecular_weights = np.array(
+            [substance.molecular_weight for substance in self.substances]
+        )
+        self.normal_boiling_points = np.array(
+            [substance.normal_boiling_point for substance in self.substances]
+        )
+        self.normal_melting_points = np.array(
+            [substance.normal_melting_point for substance in self.substances]
+        )
+        self.critical_temperatures = np.array(
+            [substance.critical_temperature for substance in self.substances]
+        )
+        self.critical_pressures = np.array(
+            [substance.critical_pressure for substance in self.substances]
+        )
+        self.acentric_factors = np.array(
+            [substance.acentric_factor for substance in self.substances]
+        )
+        self.formation_enthalpies = np.array(
+            [substance.formation_enthalpy for substance in self.substances]
+        )
+        self.formation_enthalpies_ig = np.array(
+            [substance.formation_enthalpy_ig for substance in self.substances]
+        )
 
         # Check for duplicates:
         if np.size(np.unique(self.names)) != np.size(self.names):
@@ -406,11 +397,10 @@ class AbstractMix(metaclass=ABCMeta):
             An array that contains the concentrations of the mixture's
             substances. [mol/m³]
         """
-        molar_densities = self.molar_density(
-            mole_fractions, temperature, pressure
-        )
+        molar_volumes = self.volume(mole_fractions, temperature, pressure)
 
-        return np.multiply(molar_densities, mole_fractions)
+        # z_i / v is z_i * rho_mix without the intermediate reciprocal.
+        return np.divide(mole_fractions, molar_volumes)
 
     def __len__(self) -> int:
         """Return the number of substances in the mixture.
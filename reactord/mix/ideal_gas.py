@@ -85,6 +85,53 @@ class IdealGas(AbstractMix):
         volume = R * np.divide(temperature, pressure)
         return volume
 
+    def concentrations(
+        self,
+        mole_fractions: NDArray,
+        temperature: Union[float, NDArray[np.float64]],
+        pressure: Union[float, NDArray[np.float64]],
+    ) -> Union[float, NDArray[np.float64]]:
+        r"""Concentrations of the mixture's substances.
+
+        Ideal gas specialization: the molar density is :math:`\frac {P} {RT}`,
+        so the concentrations are evaluated directly without going through
+        the generic molar_density/volume call chain.
+
+        Multiple mixture compositions can be specified by a moles matrix. Each
+        column of the matrix represents each mixture and each row represents
+        each substance's mole fractions. Also with temperature and pressure
+        vectors following de NumPy broadcasting rules.
+
+        .. math::
+            C_i = z_i \frac {P} {R T}
+
+        | :math:`C_i`: concentration of the mix's :math:`i`-th substance.
+        | :math:`z_i`: mole fraction of the mix's :math:`i`-th substance.
+        | :math:`R`: Ideal gas constant = 8.31446261815324
+          :math:`\frac {m^3 Pa} {K mol}`
+        | :math:`T`: temperature.
+        | :math:`P`: pressure.
+
+        Parameters
+        ----------
+        mole_fractions : NDArray
+            Mole fractions of each substance specified in the same order as the
+            mix's substances order.
+        temperature: Union[float, NDArray[np.float64]]
+            Temperature. [K]
+        pressure: Union[float, NDArray[np.float64]]
+            Pressure. [Pa]
+
+        Returns
+        -------
+        Union[float, NDArray[np.float64]]
+            An array that contains the concentrations of the mixture's
+            substances. [mol/m³]
+        """
+        molar_densities = np.divide(pressure, R * temperature)
+
+        return np.multiply(molar_densities, mole_fractions)
+
     def mix_heat_capacity(
         self,
         mole_fractions: np.ndarray,
@@ -133,8 +180,9 @@ class IdealGas(AbstractMix):
             ]
         )
 
-        # The next line is equal to a column-wise dot product of the two arrays
-        mix_cp = np.multiply(mole_fractions, pure_cp).sum(axis=0)
+        # Column-wise dot product of the two arrays, contracted over the
+        # substances axis without the elementwise intermediate.
+        mix_cp = np.einsum("i...,i...->...", mole_fractions, pure_cp)
         return mix_cp
 
     def formation_enthalpies_correction(
@@ -177,15 +225,14 @@ class IdealGas(AbstractMix):
         Union[float, NDArray[np.float64]]
             Formation enthalpies of each substance (J/mol/K)
         """
-        correction_enthalpies = np.array([])
-
-        for substance in self.substances:
-            correction_enthalpies = np.append(
-                correction_enthalpies,
+        correction_enthalpies = np.array(
+            [
                 substance.heat_capacity_gas_dt_integral(
                     298.15, temperature, pressure
-                ),
-            )
+                )
+                for substance in self.substances
+            ]
+        )
 
         return correction_enthalpies
 
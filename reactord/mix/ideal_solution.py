@@ -146,8 +146,9 @@ class IdealSolution(AbstractMix):
             ]
         )
 
-        # The next line is equal to a column-wise dot product of the two arrays
-        mix_cp = np.multiply(mole_fractions, pure_cp).sum(axis=0)
+        # Column-wise dot product of the two arrays, contracted over the
+        # substances axis without the elementwise intermediate.
+        mix_cp = np.einsum("i...,i...->...", mole_fractions, pure_cp)
         return mix_cp
 
     def formation_enthalpies_correction(
@@ -175,7 +176,7 @@ class IdealSolution(AbstractMix):
         correction_enthalpies : Union[float, NDArray[np.float64]]
             Formation enthalpies correction for each substance (J/mol/K)
         """
-        correction_enthalpies = np.array([])
+        corrections = []
         for substance in self.substances:
             if substance.normal_melting_point > 298.15:
                 dhs = substance.heat_capacity_solid_dt_integral(
@@ -186,17 +187,15 @@ class IdealSolution(AbstractMix):
                     substance.normal_melting_point, temperature, pressure
                 )
 
-                correction_enthalpies = np.append(
-                    correction_enthalpies, dhs + dhf + dhl
-                )
+                corrections.append(dhs + dhf + dhl)
             else:
-                correction_enthalpies = np.append(
-                    correction_enthalpies,
+                corrections.append(
                     substance.heat_capacity_liquid_dt_integral(
                         298.15, temperature, pressure
-                    ),
+                    )
                 )
-        return correction_enthalpies
+
+        return np.array(corrections)
 
     def get_formation_enthalpies(self):
         """Return the formation enthalpies in a ordered ndarray.
@@ -110,11 +110,19 @@ def test_fogler_p1_15a():
         reactor.pressure_profile,
     )
 
-    assert np.allclose(
-        reactord_concentrations[0, :], fogler_a_concentration, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations[0, :],
+        fogler_a_concentration,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
-    assert np.allclose(
-        reactord_concentrations[1, :], fogler_b_concentration, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations[1, :],
+        fogler_b_concentration,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
 
     # =========================================================================
@@ -154,11 +162,19 @@ def test_fogler_p1_15a():
         reactor1.pressure_profile,
     )
 
-    assert np.allclose(
-        reactord_concentrations1[0, :], fogler_a_concentration1, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations1[0, :],
+        fogler_a_concentration1,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
-    assert np.allclose(
-        reactord_concentrations1[1, :], fogler_b_concentration1, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations1[1, :],
+        fogler_b_concentration1,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
 
     # =========================================================================
@@ -195,11 +211,19 @@ def test_fogler_p1_15a():
         reactor2.pressure_profile,
     )
 
-    assert np.allclose(
-        reactord_concentrations2[0, :], fogler_a_concentration2, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations2[0, :],
+        fogler_a_concentration2,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
-    assert np.allclose(
-        reactord_concentrations2[1, :], fogler_b_concentration2, atol=1e-8
+    np.testing.assert_allclose(
+        reactord_concentrations2[1, :],
+        fogler_b_concentration2,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
     )
 
 
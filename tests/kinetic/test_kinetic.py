@@ -372,3 +372,11 @@ def test_raises():
             },
             kinetic_constants={},
         )
+
+    with pytest.raises(ValueError):
+        rd.Kinetic(
+            mix=mix,
+            reactions={"r1": {"eq": a + b > c, "rate": rate}},
+            kinetic_constants={},
+            rates_argument="fugacity",
+        )